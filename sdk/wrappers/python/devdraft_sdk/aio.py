@@ -0,0 +1,518 @@
+"""
+DevDraft Python SDK - asyncio client
+
+Async counterpart of DevDraftClient built on aiohttp, with the same retry,
+backoff and error handling. Page-based results can be fetched concurrently
+once the total page count is known.
+
+Requires the optional dependency: pip install devdraft-sdk[async]
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from urllib.parse import quote, quote_plus, urlencode, urlsplit
+
+import aiohttp
+from yarl import URL
+
+from . import (
+    APIError,
+    SDKOptions,
+    _PATH_SAFE_CHARS,
+    _RETRYABLE_STATUSES,
+    _BaseClient,
+    _build_default_headers,
+    _dumps,
+    _parse_retry_after,
+    _split_path,
+)
+
+
+class AsyncDevDraftClient(_BaseClient):
+    """Asyncio SDK client for DevDraft API."""
+    
+    def __init__(
+        self,
+        options: Union[SDKOptions, Dict[str, Any]],
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """
+        Initialize the async DevDraft API client.
+        
+        Args:
+            options: SDK configuration options
+            session: Existing aiohttp session to use; the client creates (and
+                closes) its own when omitted. Requests still use
+                ``options.timeout_seconds``, not the session's timeout
+            
+        Example:
+            >>> async with AsyncDevDraftClient({
+            ...     'base_url': 'https://api.devdraft.ai/v1',
+            ...     'api_key': 'your-api-key'
+            ... }) as client:
+            ...     customer = await client.get('/customers/123')
+        """
+        if isinstance(options, dict):
+            options = SDKOptions(**options)
+        
+        self.options = options
+        parts = urlsplit(options.base_url)
+        base_path = quote(parts.path.rstrip("/"), safe=_PATH_SAFE_CHARS)
+        self._base = f"{parts.scheme or 'https'}://{parts.netloc}{base_path}/"
+        self.default_headers = _build_default_headers(options)
+        # Passed per request, so it also applies to a caller-supplied session
+        self._timeout = aiohttp.ClientTimeout(
+            sock_connect=options.timeout_seconds,
+            sock_read=options.timeout_seconds,
+        )
+        
+        # One session (and connection pool) for the lifetime of the client
+        self._session = session
+        self._owns_session = session is None
+    
+    async def __aenter__(self) -> "AsyncDevDraftClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying session if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use (inside the event loop)."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=self._timeout)
+        return self._session
+    
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        query: Optional[str] = None,
+    ) -> Any:
+        """
+        Make HTTP request with retry logic.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            params: Query parameters
+            data: Request body data
+            headers: Additional headers
+            query: Pre-encoded query string, used instead of params
+            
+        Returns:
+            Parsed response data
+            
+        Raises:
+            APIError: On request failure
+        """
+        path, path_query = _split_path(path)
+        url = self._base + path
+        if query is None and params:
+            query = urlencode(params)
+        if path_query:
+            # A query string written into the path goes first, then params
+            query = f"{path_query}&{query}" if query else path_query
+        target = f"{url}?{query}" if query else url
+        request_headers = (
+            self.default_headers if not headers else {**self.default_headers, **headers}
+        )
+        
+        # Encode request body
+        body = None
+        if data is not None:
+            body = _dumps(data)
+        
+        session = self._get_session()
+        
+        # Retry loop
+        for attempt in range(self.options.max_retries + 1):
+            try:
+                if self.options.debug:
+                    self._log(
+                        f"{method} {url} "
+                        f"(attempt {attempt + 1}/{self.options.max_retries + 1})"
+                    )
+                
+                # Query is already encoded; encoded=True stops yarl re-quoting it
+                async with session.request(
+                    method,
+                    URL(target, encoded=True),
+                    data=body,
+                    headers=request_headers,
+                    timeout=self._timeout,
+                ) as response:
+                    status = response.status
+                    retry_after = response.headers.get("Retry-After")
+                    response_data = await response.read()
+                
+                if self.options.debug:
+                    self._log(f"Response: {status}")
+                
+                # Handle successful responses
+                if 200 <= status < 300:
+                    if status == 204:
+                        return None
+                    return self._parse_response(response_data)
+                
+                # Handle retryable errors
+                if status in _RETRYABLE_STATUSES and attempt < self.options.max_retries:
+                    # Calculate backoff, preferring the server's Retry-After when parseable
+                    server_delay = _parse_retry_after(retry_after) if retry_after else None
+                    backoff = server_delay if server_delay is not None else self._backoff(attempt)
+                    
+                    if self.options.debug:
+                        self._log(f"Retrying after {backoff:.2f}s")
+                    await asyncio.sleep(backoff)
+                    continue
+                
+                # Handle error responses
+                error_data = self._parse_response(response_data)
+                raise self._create_error(status, error_data)
+                
+            except aiohttp.InvalidURL as e:
+                # Retrying cannot fix a malformed URL (same policy as the sync client)
+                raise APIError(f"HTTP error: {str(e)}", code="HTTP_ERROR") from e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Transport failures (timeouts, resets, protocol errors) are retryable;
+                # anything else, including APIError for error responses, propagates
+                if attempt < self.options.max_retries:
+                    backoff = self._backoff(attempt)
+                    if self.options.debug:
+                        self._log(f"HTTP error, retrying after {backoff:.2f}s: {e}")
+                    await asyncio.sleep(backoff)
+                    continue
+                raise APIError(f"HTTP error: {str(e)}", code="HTTP_ERROR")
+        
+        # Should not reach here, but just in case
+        raise APIError("Max retries exceeded", code="MAX_RETRIES_EXCEEDED")
+    
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Make a GET request.
+        
+        Args:
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            Response data
+        """
+        return await self._make_request("GET", path, params=params)
+    
+    async def post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """
+        Make a POST request.
+        
+        Args:
+            path: API path
+            data: Request body
+            idempotency_key: Idempotency key for safe retries
+            
+        Returns:
+            Response data
+        """
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        
+        return await self._make_request("POST", path, data=data, headers=headers)
+    
+    async def patch(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Make a PATCH request.
+        
+        Args:
+            path: API path
+            data: Request body
+            
+        Returns:
+            Response data
+        """
+        return await self._make_request("PATCH", path, data=data)
+    
+    async def put(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Make a PUT request.
+        
+        Args:
+            path: API path
+            data: Request body
+            
+        Returns:
+            Response data
+        """
+        return await self._make_request("PUT", path, data=data)
+    
+    async def delete(self, path: str) -> Any:
+        """
+        Make a DELETE request.
+        
+        Args:
+            path: API path
+            
+        Returns:
+            Response data (usually None for 204)
+        """
+        return await self._make_request("DELETE", path)
+    
+    async def paginate_cursor(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        cursor_param: str = "cursor",
+        items_key: str = "items",
+        next_cursor_key: str = "nextCursor",
+        has_more_key: str = "hasMore",
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Paginate through cursor-based API results.
+        
+        Pages are fetched one after another, since each cursor comes from the
+        previous response.
+        
+        Args:
+            path: API path
+            params: Query parameters
+            cursor_param: Name of cursor query parameter
+            items_key: Name of items array in response
+            next_cursor_key: Name of next cursor field in response
+            has_more_key: Name of hasMore boolean field in response
+            
+        Yields:
+            Individual items from paginated results
+            
+        Example:
+            >>> async for customer in client.paginate_cursor('/customers'):
+            ...     print(customer['email'])
+        """
+        async for items in self._cursor_pages(
+            path, params, cursor_param, items_key, next_cursor_key, has_more_key
+        ):
+            for item in items:
+                yield item
+    
+    async def _cursor_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        cursor_param: str = "cursor",
+        items_key: str = "items",
+        next_cursor_key: str = "nextCursor",
+        has_more_key: str = "hasMore",
+    ) -> AsyncGenerator[List[Any], None]:
+        """Yield the items list of each page of cursor-based results."""
+        # Encode the static params once; only the cursor changes between pages
+        params = params or {}
+        query = urlencode(params)
+        static_query = urlencode({k: v for k, v in params.items() if k != cursor_param})
+        cursor_prefix = f"{static_query}&" if static_query else ""
+        cursor_prefix += f"{quote_plus(cursor_param)}="
+        cursor = None
+        has_more = True
+        
+        while has_more:
+            if cursor:
+                query = cursor_prefix + quote_plus(str(cursor))
+            
+            response = await self._make_request("GET", path, query=query)
+            yield response.get(items_key, [])
+            
+            cursor = response.get(next_cursor_key)
+            has_more = response.get(has_more_key, False)
+            
+            if not cursor or not has_more:
+                break
+    
+    async def paginate_page(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_param: str = "page",
+        per_page_param: str = "perPage",
+        items_key: str = "items",
+        total_pages_key: str = "totalPages",
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Paginate through page-based API results, one page at a time.
+        
+        Args:
+            path: API path
+            params: Query parameters
+            page_param: Name of page query parameter
+            per_page_param: Name of per-page query parameter
+            items_key: Name of items array in response
+            total_pages_key: Name of total pages field in response
+            
+        Yields:
+            Individual items from paginated results
+            
+        Example:
+            >>> async for product in client.paginate_page('/products', {'perPage': 50}):
+            ...     print(product['name'])
+        """
+        async for items in self._numbered_pages(
+            path, params, page_param, per_page_param, items_key, total_pages_key
+        ):
+            for item in items:
+                yield item
+    
+    async def _numbered_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        page_param: str = "page",
+        per_page_param: str = "perPage",
+        items_key: str = "items",
+        total_pages_key: str = "totalPages",
+    ) -> AsyncGenerator[List[Any], None]:
+        """Yield the items list of each page of page-based results."""
+        # Encode the static params once; only the page number changes between pages
+        static_query = urlencode({k: v for k, v in (params or {}).items() if k != page_param})
+        page_prefix = f"{static_query}&" if static_query else ""
+        page_prefix += f"{quote_plus(page_param)}="
+        page = 1
+        total_pages = 1
+        
+        while page <= total_pages:
+            response = await self._make_request("GET", path, query=page_prefix + str(page))
+            yield response.get(items_key, [])
+            
+            total_pages = response.get(total_pages_key, page)
+            page += 1
+    
+    async def paginate_page_concurrent(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = 5,
+        page_param: str = "page",
+        items_key: str = "items",
+        total_pages_key: str = "totalPages",
+    ) -> List[Any]:
+        """
+        Fetch all page-based results, requesting pages concurrently.
+        
+        The first page is fetched to learn the total page count; the remaining
+        pages are then requested in parallel, at most ``concurrency`` at a time.
+        
+        Args:
+            path: API path
+            params: Query parameters
+            concurrency: Maximum number of requests in flight
+            page_param: Name of page query parameter
+            items_key: Name of items array in response
+            total_pages_key: Name of total pages field in response
+            
+        Returns:
+            List of all items, in page order
+            
+        Raises:
+            ValueError: If concurrency is less than 1
+            APIError: On request failure; page requests still in flight are cancelled
+            
+        Example:
+            >>> products = await client.paginate_page_concurrent('/products', concurrency=8)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        static_query = urlencode({k: v for k, v in (params or {}).items() if k != page_param})
+        page_prefix = f"{static_query}&" if static_query else ""
+        page_prefix += f"{quote_plus(page_param)}="
+        
+        first = await self._make_request("GET", path, query=page_prefix + "1")
+        result: List[Any] = list(first.get(items_key, []))
+        total_pages: int = first.get(total_pages_key, 1)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(page: int) -> List[Any]:
+            async with semaphore:
+                response = await self._make_request("GET", path, query=page_prefix + str(page))
+            items: List[Any] = response.get(items_key, [])
+            return items
+        
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, total_pages + 1)]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed page (or cancellation) stops the other fetches instead of
+            # leaving them running in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        for items in pages:
+            result.extend(items)
+        return result
+    
+    async def get_all_cursor(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        Fetch all pages and return as list (cursor-based).
+        
+        Args:
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            List of all items
+        """
+        result: List[Any] = []
+        async for items in self._cursor_pages(path, params):
+            result.extend(items)
+        return result
+    
+    async def get_all_page(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        Fetch all pages and return as list (page-based).
+        
+        Args:
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            List of all items
+        """
+        result: List[Any] = []
+        async for items in self._numbered_pages(path, params):
+            result.extend(items)
+        return result
+
+
+__all__ = [
+    "AsyncDevDraftClient",
+]
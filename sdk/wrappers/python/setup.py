@@ -25,10 +25,15 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     python_requires=">=3.8",
-    install_requires=[
-        "urllib3>=2.0.0",
-    ],
+    install_requires=[],
     extras_require={
+        "fast": [
+            "orjson>=3.9",
+            "brotli>=1.0",
+        ],
+        "async": [
+            "aiohttp>=3.8",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,105 @@
+"""Local HTTP server fixture for exercising the SDK against real sockets."""
+
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+
+@dataclass
+class RecordedRequest:
+    """A request as received by the test server."""
+    
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes
+    client_port: int
+
+
+# A route returns (status, headers, payload); non-bytes payloads are sent as JSON
+Reply = Tuple[int, Dict[str, str], Any]
+Route = Callable[[RecordedRequest], Reply]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "LocalServer"
+    
+    def setup(self) -> None:
+        # Idle keep-alive timeout: the handler closes the connection once it expires
+        self.timeout = self.server.keep_alive_timeout
+        super().setup()
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        request = RecordedRequest(
+            method=self.command,
+            path=self.path,
+            headers=dict(self.headers),
+            body=self.rfile.read(length) if length else b"",
+            client_port=self.client_address[1],
+        )
+        self.server.requests.append(request)
+        
+        route = self.server.routes.get(urlsplit(self.path).path)
+        status, headers, payload = route(request) if route else (200, {}, {"path": self.path})
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode("utf-8")
+        
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 204:
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if status != 204:
+            self.wfile.write(payload)
+    
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class LocalServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server on 127.0.0.1 that records requests and serves routes."""
+    
+    daemon_threads = True
+    
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[RecordedRequest] = []
+        self.keep_alive_timeout: Optional[float] = None
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+    
+    def route(self, path: str) -> Callable[[Route], Route]:
+        """Register a handler for a request path (query string excluded)."""
+        def register(func: Route) -> Route:
+            self.routes[path] = func
+            return func
+        return register
+    
+    def client_ports(self) -> List[int]:
+        """Client-side port of each request, one per TCP connection used."""
+        return [request.client_port for request in self.requests]
+
+
+@pytest.fixture
+def server() -> Generator[LocalServer, None, None]:
+    srv = LocalServer()
+    thread = threading.Thread(
+        target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
@@ -0,0 +1,179 @@
+"""Tests for AsyncDevDraftClient against a local HTTP server."""
+
+import asyncio
+import time
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from devdraft_sdk import APIError  # noqa: E402
+from devdraft_sdk.aio import AsyncDevDraftClient  # noqa: E402
+
+
+def make_client(server: Any, **options: Any) -> AsyncDevDraftClient:
+    config: Dict[str, Any] = {"base_url": f"{server.url}/v1", "retry_base_delay": 0.01}
+    config.update(options)
+    return AsyncDevDraftClient(config)
+
+
+def run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+def add_page_route(server: Any, total_pages: int = 4) -> None:
+    @server.route("/v1/products")
+    def products(request):
+        page = int(parse_qs(urlsplit(request.path).query)["page"][0])
+        return 200, {}, {"items": [f"p{page}a", f"p{page}b"], "totalPages": total_pages}
+
+
+def add_cursor_route(server: Any) -> None:
+    @server.route("/v1/customers")
+    def customers(request):
+        cursor = int(parse_qs(urlsplit(request.path).query).get("cursor", ["0"])[0])
+        return 200, {}, {"items": [cursor], "nextCursor": str(cursor + 1), "hasMore": cursor < 2}
+
+
+class TestAsyncClient:
+    def test_get_and_post(self, server):
+        async def scenario():
+            async with make_client(server, api_key="key") as client:
+                fetched = await client.get("/customers/a b", {"expand": "orders"})
+                created = await client.post("/customers", {"email": "a@example.com"}, "idem-1")
+                return fetched, created
+        
+        fetched, created = run(scenario())
+        
+        assert fetched == {"path": "/v1/customers/a%20b?expand=orders"}
+        assert created == {"path": "/v1/customers"}
+        assert server.requests[1].body == b'{"email":"a@example.com"}'
+        assert server.requests[1].headers["Idempotency-Key"] == "idem-1"
+        assert server.requests[1].headers["X-API-Key"] == "key"
+    
+    def test_query_in_path_is_kept(self, server):
+        async def scenario():
+            async with make_client(server) as client:
+                return await client.get("/customers?limit=5#top", {"q": "a b"})
+        
+        assert run(scenario()) == {"path": "/v1/customers?limit=5&q=a+b"}
+    
+    def test_error_response_is_not_retried(self, server):
+        @server.route("/v1/missing")
+        def missing(request):
+            return 404, {}, {"message": "Not found", "code": "NOT_FOUND"}
+        
+        async def scenario():
+            async with make_client(server) as client:
+                await client.get("/missing")
+        
+        with pytest.raises(APIError) as excinfo:
+            run(scenario())
+        assert excinfo.value.status == 404
+        assert len(server.requests) == 1
+    
+    def test_invalid_url_is_not_retried(self, server, monkeypatch):
+        sleeps = []
+        
+        async def record_sleep(delay):
+            sleeps.append(delay)
+        
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        
+        async def scenario():
+            async with make_client(server, base_url="http:///v1") as client:
+                await client.get("/customers")
+        
+        with pytest.raises(APIError) as excinfo:
+            run(scenario())
+        assert excinfo.value.code == "HTTP_ERROR"
+        assert isinstance(excinfo.value.__cause__, aiohttp.InvalidURL)
+        assert sleeps == []
+    
+    def test_timeout_applies_to_a_caller_session(self, server):
+        @server.route("/v1/slow")
+        def slow(request):
+            time.sleep(1)
+            return 200, {}, {}
+        
+        async def scenario():
+            async with aiohttp.ClientSession() as session:
+                client = AsyncDevDraftClient(
+                    {"base_url": f"{server.url}/v1", "timeout_seconds": 0.2, "max_retries": 0},
+                    session=session,
+                )
+                await client.get("/slow")
+        
+        started = time.monotonic()
+        with pytest.raises(APIError) as excinfo:
+            run(scenario())
+        assert excinfo.value.code == "HTTP_ERROR"
+        assert time.monotonic() - started < 0.9
+    
+    def test_get_all_cursor(self, server):
+        add_cursor_route(server)
+        
+        async def scenario():
+            async with make_client(server) as client:
+                return await client.get_all_cursor("/customers", {"status": "active"})
+        
+        assert run(scenario()) == [0, 1, 2]
+        assert [r.path for r in server.requests] == [
+            "/v1/customers?status=active",
+            "/v1/customers?status=active&cursor=1",
+            "/v1/customers?status=active&cursor=2",
+        ]
+    
+    def test_get_all_page(self, server):
+        add_page_route(server, total_pages=2)
+        
+        async def scenario():
+            async with make_client(server) as client:
+                return await client.get_all_page("/products")
+        
+        assert run(scenario()) == ["p1a", "p1b", "p2a", "p2b"]
+    
+    def test_paginate_page_concurrent_keeps_page_order(self, server):
+        add_page_route(server, total_pages=5)
+        
+        async def scenario():
+            async with make_client(server) as client:
+                return await client.paginate_page_concurrent(
+                    "/products", {"perPage": 2}, concurrency=3
+                )
+        
+        items = run(scenario())
+        
+        assert items == [f"p{page}{suffix}" for page in range(1, 6) for suffix in "ab"]
+        assert sorted(r.path for r in server.requests) == [
+            f"/v1/products?perPage=2&page={page}" for page in range(1, 6)
+        ]
+    
+    def test_paginate_page_concurrent_rejects_zero_concurrency(self, server):
+        async def scenario():
+            async with make_client(server) as client:
+                await client.paginate_page_concurrent("/products", concurrency=0)
+        
+        with pytest.raises(ValueError):
+            run(scenario())
+        assert server.requests == []
+    
+    def test_paginate_page_concurrent_cancels_pages_after_a_failure(self, server):
+        @server.route("/v1/products")
+        def products(request):
+            page = int(parse_qs(urlsplit(request.path).query)["page"][0])
+            if page == 2:
+                return 404, {}, {"message": "Not found"}
+            if page > 2:
+                time.sleep(0.5)
+            return 200, {}, {"items": [page], "totalPages": 4}
+        
+        async def scenario():
+            async with make_client(server) as client:
+                with pytest.raises(APIError):
+                    await client.paginate_page_concurrent("/products", concurrency=3)
+                return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        
+        assert run(scenario()) == []
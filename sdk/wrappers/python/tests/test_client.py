@@ -0,0 +1,435 @@
+"""Tests for DevDraftClient against a local HTTP server."""
+
+import gzip
+import http.client
+import json
+import threading
+import time
+import zlib
+from email.utils import formatdate
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import devdraft_sdk
+from devdraft_sdk import APIError, DevDraftClient
+
+
+def make_client(server: Any, **options: Any) -> DevDraftClient:
+    config: Dict[str, Any] = {"base_url": f"{server.url}/v1", "retry_base_delay": 0.01}
+    config.update(options)
+    return DevDraftClient(config)
+
+
+class TestJSONEncoding:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"email": "user@example.com", "tags": ["a", "b"]},
+            {1: "int key", "name": "jos\u00e9"},
+            {"amount": 2 ** 70},
+        ],
+    )
+    def test_body_matches_stdlib_encoding(self, data):
+        encoded = devdraft_sdk._dumps(data)
+        assert json.loads(encoded) == json.loads(devdraft_sdk._stdlib_dumps(data))
+    
+    def test_unserializable_body_raises_type_error(self):
+        with pytest.raises(TypeError):
+            devdraft_sdk._dumps({"value": object()})
+
+
+class TestOptions:
+    def test_clients_from_equal_dicts_do_not_share_options(self):
+        config = {"base_url": "https://api.example.com/v1", "api_key": "key"}
+        first = DevDraftClient(config)
+        second = DevDraftClient(config)
+        first.options.max_retries = 0
+        
+        assert second.options.max_retries == 3
+        assert DevDraftClient(config).options.max_retries == 3
+
+
+class TestRequestPaths:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/customers/123", "/v1/customers/123"),
+            ("customers/123", "/v1/customers/123"),
+            ("/customers/a b", "/v1/customers/a%20b"),
+            ("/customers/jos\u00e9", "/v1/customers/jos%C3%A9"),
+            ("/customers/a%20b", "/v1/customers/a%20b"),
+            ("/files/a:b@c+d", "/v1/files/a:b@c+d"),
+        ],
+    )
+    def test_path_is_percent_encoded(self, server, path, expected):
+        client = make_client(server)
+        client.get(path)
+        
+        assert server.requests[0].path == expected
+    
+    @pytest.mark.parametrize(
+        "path, params, expected",
+        [
+            ("/customers?limit=5", None, "/v1/customers?limit=5"),
+            ("/customers?limit=5", {"q": "a b"}, "/v1/customers?limit=5&q=a+b"),
+            ("/customers/a b?limit=5#top", None, "/v1/customers/a%20b?limit=5"),
+            ("/customers#top", {"q": "x"}, "/v1/customers?q=x"),
+        ],
+    )
+    def test_query_in_path_is_kept(self, server, path, params, expected):
+        client = make_client(server)
+        client.get(path, params)
+        
+        assert server.requests[0].path == expected
+
+
+class TestHeaders:
+    def test_changed_default_headers_apply_to_every_request(self, server):
+        client = make_client(server)
+        client.get("/customers")
+        client.default_headers["X-Tenant"] = "t1"
+        
+        client.get("/customers")
+        client.post("/customers", {"email": "a@example.com"})
+        client.post("/customers", {"email": "a@example.com"}, idempotency_key="idem-1")
+        
+        assert "X-Tenant" not in server.requests[0].headers
+        assert [r.headers.get("X-Tenant") for r in server.requests[1:]] == ["t1"] * 3
+    
+    def test_replaced_default_headers_are_sent(self, server):
+        client = make_client(server)
+        client.get("/customers")
+        client.default_headers = {**client.default_headers, "X-Tenant": "t2"}
+        del client.default_headers["X-SDK-Language"]
+        
+        client.get("/customers")
+        
+        assert server.requests[1].headers.get("X-Tenant") == "t2"
+        assert "X-SDK-Language" not in server.requests[1].headers
+
+
+class TestDebugLogging:
+    def test_debug_off_skips_logging(self, server, monkeypatch, capsys):
+        def fail(self, message):
+            raise AssertionError(f"unexpected log: {message}")
+        
+        monkeypatch.setattr(DevDraftClient, "_log", fail)
+        client = make_client(server)
+        
+        client.get("/customers")
+        assert capsys.readouterr().out == ""
+    
+    def test_debug_enabled_after_construction_logs(self, server, capsys):
+        client = make_client(server)
+        client.options.debug = True
+        
+        client.get("/customers")
+        out = capsys.readouterr().out
+        assert "[DevDraft] GET " in out
+        assert "Response: 200" in out
+
+
+class TestRetries:
+    def test_transport_error_is_retried(self, server):
+        client = make_client(server, base_url="http://127.0.0.1:1", max_retries=2)
+        
+        with pytest.raises(APIError) as excinfo:
+            client.get("/customers")
+        assert excinfo.value.code == "HTTP_ERROR"
+    
+    def test_invalid_url_is_not_retried(self, server):
+        client = make_client(server, retry_base_delay=10)
+        
+        with pytest.raises(APIError) as excinfo:
+            client._make_request("GET", "/customers", query="q=a b")
+        assert excinfo.value.code == "HTTP_ERROR"
+        assert isinstance(excinfo.value.__cause__, http.client.InvalidURL)
+        assert server.requests == []
+    
+    def test_oversized_response_header_is_not_retried(self, server):
+        @server.route("/v1/huge")
+        def huge(request):
+            return 200, {"X-Huge": "x" * 70000}, {}
+        
+        client = make_client(server, retry_base_delay=10)
+        
+        with pytest.raises(APIError) as excinfo:
+            client.get("/huge")
+        assert excinfo.value.code == "HTTP_ERROR"
+        assert isinstance(excinfo.value.__cause__, http.client.LineTooLong)
+        assert len(server.requests) == 1
+    
+    def test_error_response_is_not_retried(self, server):
+        @server.route("/v1/missing")
+        def missing(request):
+            return 404, {}, {"message": "Not found", "code": "NOT_FOUND", "requestId": "req_1"}
+        
+        client = make_client(server)
+        
+        with pytest.raises(APIError) as excinfo:
+            client.get("/missing")
+        assert (excinfo.value.status, excinfo.value.code) == (404, "NOT_FOUND")
+        assert excinfo.value.request_id == "req_1"
+        assert len(server.requests) == 1
+    
+    def test_retries_exhausted_raises_last_error(self, server):
+        @server.route("/v1/down")
+        def down(request):
+            return 503, {}, {"message": "Unavailable", "code": "UNAVAILABLE"}
+        
+        client = make_client(server, max_retries=2)
+        
+        with pytest.raises(APIError) as excinfo:
+            client.get("/down")
+        assert (excinfo.value.status, excinfo.value.code) == (503, "UNAVAILABLE")
+        assert len(server.requests) == 3
+
+
+class TestBackoff:
+    def make_client(self, **options: Any) -> DevDraftClient:
+        return DevDraftClient({"base_url": "https://api.example.com/v1", **options})
+    
+    @pytest.mark.parametrize("attempt", [0, 1, 3])
+    def test_jitter_stays_within_bounds(self, monkeypatch, attempt):
+        client = self.make_client(retry_base_delay=0.5, retry_jitter=0.25)
+        expected = 0.5 * 2 ** attempt
+        
+        monkeypatch.setattr(devdraft_sdk.random, "random", lambda: 0.0)
+        assert client._backoff(attempt) == expected
+        monkeypatch.setattr(devdraft_sdk.random, "random", lambda: 0.999999)
+        assert expected < client._backoff(attempt) < expected * 1.25
+    
+    def test_delay_is_capped_at_retry_max_delay(self, monkeypatch):
+        monkeypatch.setattr(devdraft_sdk.random, "random", lambda: 0.999999)
+        client = self.make_client(retry_base_delay=1.0, retry_max_delay=5.0)
+        
+        assert client._backoff(1) < 5.0
+        assert client._backoff(3) == 5.0
+        assert client._backoff(20) == 5.0
+    
+    def test_zero_jitter_is_deterministic(self):
+        client = self.make_client(retry_base_delay=0.25, retry_jitter=0.0)
+        
+        assert [client._backoff(attempt) for attempt in range(4)] == [0.25, 0.5, 1.0, 2.0]
+
+
+class TestResponses:
+    def test_no_content_returns_none_and_keeps_connection(self, server):
+        @server.route("/v1/customers/1")
+        def delete(request):
+            return 204, {}, b""
+        
+        client = make_client(server)
+        
+        assert client.delete("/customers/1") is None
+        assert client.get("/customers") == {"path": "/v1/customers"}
+        assert len(set(server.client_ports())) == 1
+    
+    @pytest.mark.parametrize(
+        "encoding, compress",
+        [
+            ("gzip", gzip.compress),
+            ("deflate", zlib.compress),
+            ("deflate", lambda data: zlib.compress(data)[2:-4]),  # raw deflate, no zlib wrapper
+        ],
+    )
+    def test_compressed_response_is_decoded(self, server, encoding, compress):
+        @server.route("/v1/report")
+        def report(request):
+            return 200, {"Content-Encoding": encoding}, compress(b'{"rows":[1,2,3]}')
+        
+        client = make_client(server)
+        
+        assert client.get("/report") == {"rows": [1, 2, 3]}
+        assert "gzip" in server.requests[0].headers["Accept-Encoding"]
+    
+    def test_corrupt_compressed_response_is_a_transport_error(self, server):
+        @server.route("/v1/report")
+        def report(request):
+            return 200, {"Content-Encoding": "gzip"}, b"not gzip"
+        
+        client = make_client(server, max_retries=1)
+        
+        with pytest.raises(APIError) as excinfo:
+            client.get("/report")
+        assert excinfo.value.code == "HTTP_ERROR"
+        assert len(server.requests) == 2
+
+
+class TestRetryAfter:
+    def flaky_route(self, server, retry_after):
+        @server.route("/v1/flaky")
+        def flaky(request):
+            if len(server.requests) == 1:
+                return 503, {"Retry-After": retry_after}, {"message": "Busy"}
+            return 200, {}, {"ok": True}
+    
+    @pytest.mark.parametrize(
+        "retry_after",
+        ["0", "Wed, 21 Oct 2015 07:28:00 GMT", "not a date"],
+    )
+    def test_retryable_status_is_retried(self, server, retry_after):
+        self.flaky_route(server, retry_after)
+        client = make_client(server)
+        
+        assert client.get("/flaky") == {"ok": True}
+        assert len(server.requests) == 2
+    
+    def test_http_date_sets_the_delay(self, server, monkeypatch):
+        self.flaky_route(server, formatdate(time.time() + 30, usegmt=True))
+        sleeps = []
+        monkeypatch.setattr(devdraft_sdk.time, "sleep", sleeps.append)
+        client = make_client(server)
+        
+        client.get("/flaky")
+        assert len(sleeps) == 1 and 28 <= sleeps[0] <= 30
+
+
+class TestPagination:
+    def cursor_route(self, server):
+        @server.route("/v1/customers")
+        def customers(request):
+            cursor = int(parse_qs(urlsplit(request.path).query).get("cursor", ["0"])[0])
+            return 200, {}, {
+                "items": [cursor],
+                "nextCursor": str(cursor + 1),
+                "hasMore": cursor < 2,
+            }
+    
+    def page_route(self, server):
+        @server.route("/v1/products")
+        def products(request):
+            page = int(parse_qs(urlsplit(request.path).query)["page"][0])
+            return 200, {}, {"items": [page], "totalPages": 3}
+    
+    def test_cursor_query_encoding(self, server):
+        self.cursor_route(server)
+        client = make_client(server)
+        
+        assert client.get_all_cursor("/customers", {"q": "a b&c"}) == [0, 1, 2]
+        assert [r.path for r in server.requests] == [
+            "/v1/customers?q=a+b%26c",
+            "/v1/customers?q=a+b%26c&cursor=1",
+            "/v1/customers?q=a+b%26c&cursor=2",
+        ]
+    
+    def test_starting_cursor_from_params_is_sent_first(self, server):
+        self.cursor_route(server)
+        client = make_client(server)
+        
+        assert list(client.paginate_cursor("/customers", {"cursor": "1"})) == [1, 2]
+        assert [r.path for r in server.requests] == [
+            "/v1/customers?cursor=1",
+            "/v1/customers?cursor=2",
+        ]
+    
+    def test_page_query_encoding(self, server):
+        self.page_route(server)
+        client = make_client(server)
+        
+        assert client.get_all_page("/products", {"perPage": 50, "page": 9}) == [1, 2, 3]
+        assert [r.path for r in server.requests] == [
+            "/v1/products?perPage=50&page=1",
+            "/v1/products?perPage=50&page=2",
+            "/v1/products?perPage=50&page=3",
+        ]
+    
+    def test_paginate_page_yields_items(self, server):
+        self.page_route(server)
+        client = make_client(server)
+        
+        assert list(client.paginate_page("/products")) == [1, 2, 3]
+
+
+class TestConnectionReuse:
+    def test_keep_alive_connection_is_reused(self, server):
+        client = make_client(server)
+        for _ in range(3):
+            client.get("/customers")
+        
+        assert len(set(server.client_ports())) == 1
+        assert len(client._pool) == 1
+    
+    def test_close_drops_idle_connections(self, server):
+        client = make_client(server)
+        client.get("/customers")
+        client.close()
+        
+        assert len(client._pool) == 0
+    
+    def test_connection_closed_by_server_while_idle(self, server):
+        server.keep_alive_timeout = 0.2
+        client = make_client(server, max_retries=0, retry_base_delay=10)
+        client.get("/customers")
+        time.sleep(0.5)
+        
+        started = time.monotonic()
+        assert client.get("/customers") == {"path": "/v1/customers"}
+        assert time.monotonic() - started < 1
+        assert len(set(server.client_ports())) == 2
+    
+    def test_all_stale_connections_are_discarded(self, server):
+        server.keep_alive_timeout = 0.3
+        barrier = threading.Barrier(6)
+        
+        @server.route("/v1/slow")
+        def slow(request):
+            barrier.wait(timeout=5)
+            return 200, {}, {}
+        
+        client = make_client(server, retry_base_delay=10)
+        threads = [threading.Thread(target=client.get, args=("/slow",)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(client._pool) == 6
+        time.sleep(0.6)
+        
+        started = time.monotonic()
+        assert client.get("/customers") == {"path": "/v1/customers"}
+        assert time.monotonic() - started < 1
+        assert len(client._pool) == 1
+    
+    def test_pool_keeps_at_most_pool_maxsize_connections(self, server):
+        barrier = threading.Barrier(4)
+        
+        @server.route("/v1/slow")
+        def slow(request):
+            barrier.wait(timeout=5)
+            return 200, {}, {}
+        
+        client = make_client(server, pool_maxsize=2)
+        threads = [threading.Thread(target=client.get, args=("/slow",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(set(server.client_ports())) == 4
+        assert len(client._pool) == 2
+    
+    def test_default_pool_size_follows_cpu_count(self, server, monkeypatch):
+        monkeypatch.setattr(devdraft_sdk.os, "cpu_count", lambda: 4)
+        assert make_client(server)._pool_maxsize == 20
+        
+        monkeypatch.setattr(devdraft_sdk.os, "cpu_count", lambda: None)
+        assert make_client(server)._pool_maxsize == 10
+    
+    def test_stale_connection_missed_by_check_is_resent_immediately(self, server, monkeypatch):
+        # Simulate the server closing the connection between the liveness check and the send
+        server.keep_alive_timeout = 0.2
+        monkeypatch.setattr(devdraft_sdk, "_connection_dropped", lambda conn: False)
+        client = make_client(server, max_retries=0, retry_base_delay=10)
+        client.post("/customers", {"email": "a@example.com"})
+        time.sleep(0.5)
+        
+        started = time.monotonic()
+        assert client.post("/customers", {"email": "b@example.com"}) == {"path": "/v1/customers"}
+        assert time.monotonic() - started < 1
+        assert [r.body for r in server.requests] == [
+            b'{"email":"a@example.com"}',
+            b'{"email":"b@example.com"}',
+        ]
@@ -10,18 +10,162 @@ Production-ready Python SDK with support for:
 - Telemetry headers
 """
 
+import http.client
+import os
+import random
+import select
+import sys
+import threading
 import time
-import urllib3
-from typing import Any, Dict, Generator, List, Optional, Union
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, Generator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, quote_plus, urlencode, urlsplit
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore[assignment]
+
 
 __version__ = "0.1.0"
 
 
-@dataclass
+# Stdlib encoder with compact separators, matching orjson output
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return _json_encode(obj).encode("utf-8")
+
+
+# JSON codec: orjson when installed (pip install devdraft-sdk[fast]), stdlib otherwise.
+# Both accept bytes on decode and return bytes on encode.
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        try:
+            # OPT_NON_STR_KEYS: int/float/bool/None keys become strings, as with json.dumps
+            encoded: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            return encoded
+        except orjson.JSONEncodeError:
+            # Values orjson rejects but the stdlib accepts, e.g. integers wider than 64 bits
+            return _stdlib_dumps(obj)
+else:
+    _loads = json.loads
+    _dumps = _stdlib_dumps
+
+# Content encodings we can decode, advertised via Accept-Encoding
+_ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+_DECODE_ERRORS = (zlib.error, brotli.error) if brotli is not None else (zlib.error,)
+
+
+def _decode_content(data: bytes, encoding: str) -> bytes:
+    """Decompress a response body according to its Content-Encoding."""
+    encoding = encoding.strip().lower()
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(data)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib wrapper
+                return zlib.decompress(data, -zlib.MAX_WBITS)
+        if encoding == "br" and brotli is not None:
+            decoded: bytes = brotli.decompress(data)
+            return decoded
+    except _DECODE_ERRORS as e:
+        raise http.client.HTTPException(f"Failed to decode {encoding} response body: {e}")
+    return data
+
+
+# Characters left unescaped in request paths (same set urllib3 leaves alone); anything
+# else, such as spaces or non-ASCII, is percent-encoded
+_PATH_SAFE_CHARS = "/%:@!$&'()*+,;=~"
+
+
+def _split_path(path: str) -> Tuple[str, str]:
+    """Split an API path into its percent-encoded path part and its raw query string."""
+    path = path.partition("#")[0]  # Fragments are never sent to the server
+    path, _, query = path.partition("?")
+    return quote(path.lstrip("/"), safe=_PATH_SAFE_CHARS), query
+
+# http.client errors that a retry cannot fix: malformed request targets, oversized
+# response lines and misuse of the connection state machine
+_NON_RETRYABLE_ERRORS = (
+    http.client.InvalidURL,
+    http.client.LineTooLong,
+    http.client.ImproperConnectionState,
+)
+
+# Errors meaning the server closed a keep-alive connection before it read our request
+_STALE_CONNECTION_ERRORS = (BrokenPipeError, ConnectionAbortedError, ConnectionResetError)
+
+
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Return True if the server has closed an idle keep-alive connection."""
+    sock = conn.sock
+    if sock is None:
+        return False  # Not connected yet; http.client connects on the next request
+    try:
+        # An idle connection has nothing to read: readable means EOF (or stray data)
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+# Methods that always carry Content-Length, even without a body (as http.client sends them)
+_METHODS_EXPECTING_BODY = frozenset({"PATCH", "POST", "PUT"})
+
+
+def _encode_headers(headers: Dict[str, str]) -> Tuple[Tuple[bytes, bytes], ...]:
+    """Encode a header dict into (name, value) byte pairs for http.client."""
+    return tuple(
+        (name.encode("ascii"), value.encode("latin-1"))
+        for name, value in sorted(headers.items())
+    )
+
+
+def _parse_retry_after(value: str) -> Optional[int]:
+    """Parse a Retry-After header (delay-seconds or HTTP-date) into seconds to wait."""
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, int((retry_date - datetime.now(retry_date.tzinfo)).total_seconds()))
+
+
+# Timestamp format for debug logging
+_LOG_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Status codes retried with backoff
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# slots=True (Python 3.10+) drops the per-instance __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SDKOptions:
     """SDK configuration options."""
     
@@ -30,9 +174,13 @@ class SDKOptions:
     bearer_token: Optional[str] = None
     timeout_seconds: int = 15
     max_retries: int = 3
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    retry_jitter: float = 0.5
     user_agent: str = f"devdraft-python-sdk/{__version__}"
     custom_headers: Optional[Dict[str, str]] = None
     debug: bool = False
+    pool_maxsize: Optional[int] = None
 
 
 class APIError(Exception):
@@ -70,7 +218,78 @@ class APIError(Exception):
         )
 
 
-class DevDraftClient:
+def _build_default_headers(options: SDKOptions) -> Dict[str, str]:
+    """Build the headers sent with every request."""
+    headers = {
+        "User-Agent": options.user_agent,
+        "X-SDK-Language": "python",
+        "X-SDK-Version": __version__,
+        "Content-Type": "application/json",
+        "Accept-Encoding": _ACCEPT_ENCODING,
+    }
+    
+    # Add auth headers
+    if options.bearer_token:
+        headers["Authorization"] = f"Bearer {options.bearer_token}"
+    elif options.api_key:
+        headers["X-API-Key"] = options.api_key
+    
+    # Add custom headers
+    if options.custom_headers:
+        headers.update(options.custom_headers)
+    
+    return headers
+
+
+class _BaseClient:
+    """Logging, backoff and response helpers shared by the sync and async clients."""
+    
+    options: SDKOptions
+    
+    def _log(self, message: str) -> None:
+        """Log debug message. Callers check ``self.options.debug`` first to skip formatting."""
+        timestamp = time.strftime(_LOG_TIME_FORMAT)
+        print(f"[{timestamp}] [DevDraft] {message}")
+    
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay for a retry attempt, with jitter and a cap."""
+        options = self.options
+        delay: float = options.retry_base_delay * (2 ** attempt)
+        delay *= 1 + random.random() * options.retry_jitter
+        return min(options.retry_max_delay, delay)
+    
+    def _parse_response(self, data: bytes) -> Any:
+        """Parse response body as JSON."""
+        if not data:
+            return None
+        try:
+            return _loads(data)
+        except ValueError:  # JSONDecodeError (stdlib and orjson) and UnicodeDecodeError
+            return None
+    
+    def _create_error(self, status: int, data: Optional[Dict[str, Any]]) -> APIError:
+        """Create APIError from response data."""
+        if data:
+            message = data.get("message", "Request failed")
+            code = data.get("code")
+            details = data.get("details")
+            request_id = data.get("requestId")
+        else:
+            message = f"Request failed with status {status}"
+            code = None
+            details = None
+            request_id = None
+        
+        return APIError(
+            message=message,
+            status=status,
+            code=code,
+            details=details,
+            request_id=request_id,
+        )
+
+
+class DevDraftClient(_BaseClient):
     """Main SDK client for DevDraft API."""
     
     def __init__(self, options: Union[SDKOptions, Dict[str, Any]]):
@@ -90,50 +309,144 @@ class DevDraftClient:
             options = SDKOptions(**options)
         
         self.options = options
-        self.http = urllib3.PoolManager(
-            timeout=urllib3.Timeout(
-                connect=options.timeout_seconds,
-                read=options.timeout_seconds
-            ),
-            retries=False  # We handle retries manually
+        
+        # Parse the base URL once; every request goes to the same host
+        parts = urlsplit(options.base_url)
+        if not parts.hostname:
+            raise ValueError(f"Invalid base_url: {options.base_url!r}")
+        self._scheme = parts.scheme or "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._base = quote(parts.path.rstrip("/"), safe=_PATH_SAFE_CHARS) + "/"
+        self._origin = f"{self._scheme}://{parts.netloc}"
+        self._connection_class = (
+            http.client.HTTPConnection
+            if self._scheme == "http"
+            else http.client.HTTPSConnection
         )
         
-        # Build default headers
-        self.default_headers = {
-            "User-Agent": options.user_agent,
-            "X-SDK-Language": "python",
-            "X-SDK-Version": __version__,
-            "Content-Type": "application/json",
-        }
+        # Idle keep-alive connections, reused most recent first
+        self._pool: Deque[http.client.HTTPConnection] = deque()
+        self._pool_lock = threading.Lock()
+        # Same sizing heuristic as ThreadPoolExecutor, so concurrent callers keep their connections
+        self._pool_maxsize = (
+            options.pool_maxsize
+            if options.pool_maxsize is not None
+            else max(10, (os.cpu_count() or 1) * 5)
+        )
         
-        # Add auth headers
-        if options.bearer_token:
-            self.default_headers["Authorization"] = f"Bearer {options.bearer_token}"
-        elif options.api_key:
-            self.default_headers["X-API-Key"] = options.api_key
+        self.default_headers = _build_default_headers(options)
         
-        # Add custom headers
-        if options.custom_headers:
-            self.default_headers.update(options.custom_headers)
+        # Snapshot of default_headers and its encoding; requests without extra headers
+        # send the encoding as-is until default_headers is changed
+        snapshot = dict(self.default_headers)
+        self._encoded_defaults = (snapshot, _encode_headers(snapshot))
     
-    def _log(self, message: str) -> None:
-        """Log debug message if debug is enabled."""
-        if self.options.debug:
-            timestamp = datetime.now().isoformat()
-            print(f"[{timestamp}] [DevDraft] {message}")
-    
-    def _build_url(self, path: str) -> str:
-        """Build full URL from path."""
-        base = self.options.base_url.rstrip("/")
-        path = path.lstrip("/")
-        return f"{base}/{path}"
-    
-    def _parse_response(self, response: urllib3.HTTPResponse) -> Any:
-        """Parse response body as JSON."""
+    def _default_header_pairs(self) -> Tuple[Tuple[bytes, bytes], ...]:
+        """Return the encoded default headers, re-encoding them if they were changed."""
+        snapshot, encoded = self._encoded_defaults
+        if self.default_headers != snapshot:
+            snapshot = dict(self.default_headers)
+            encoded = _encode_headers(snapshot)
+            # One tuple, so concurrent requests never see a mismatched pair
+            self._encoded_defaults = (snapshot, encoded)
+        return encoded
+    
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Create a connection to the API host (connects lazily on first request)."""
+        return self._connection_class(
+            self._host,
+            self._port,
+            timeout=self.options.timeout_seconds,
+        )
+    
+    def _acquire_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take an idle connection from the pool, or open a new one.
+        
+        Returns:
+            The connection, and whether it was reused from the pool
+        """
+        with self._pool_lock:
+            # Discard every connection the server has closed, not just the first: after an
+            # idle timeout the whole pool is usually dead
+            while self._pool:
+                conn = self._pool.pop()
+                if not _connection_dropped(conn):
+                    return conn, True
+                conn.close()
+        return self._new_connection(), False
+    
+    def _release_connection(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool for keep-alive reuse."""
+        with self._pool_lock:
+            if len(self._pool) < self._pool_maxsize:
+                self._pool.append(conn)
+                return
+        conn.close()
+    
+    def _send(
+        self,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Tuple[Tuple[bytes, bytes], ...],
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """Send a single request and read the full response body."""
+        conn, reused = self._acquire_connection()
         try:
-            return json.loads(response.data.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return None
+            try:
+                response, data = self._exchange(conn, method, target, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server closed the idle connection as we reused it; resend once on a
+                # fresh connection without spending a retry or sleeping
+                conn.close()
+                conn = self._new_connection()
+                response, data = self._exchange(conn, method, target, body, headers)
+        except BaseException:
+            conn.close()
+            raise
+        
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_connection(conn)
+        
+        content_encoding = response.getheader("Content-Encoding")
+        if content_encoding and data:
+            data = _decode_content(data, content_encoding)
+        return response, data
+    
+    def _exchange(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Tuple[Tuple[bytes, bytes], ...],
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """Write one request on a connection and read the raw response body."""
+        # Accept-Encoding is part of the default headers
+        conn.putrequest(method, target, skip_accept_encoding=True)
+        for name, value in headers:
+            conn.putheader(name, value)
+        if body is not None or method in _METHODS_EXPECTING_BODY:
+            conn.putheader(b"Content-Length", b"%d" % len(body or b""))
+        conn.endheaders(body)
+        response = conn.getresponse()
+        if response.status == 204:
+            # No body; closing the response frees the connection for reuse
+            response.close()
+            return response, b""
+        return response, response.read()
+    
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._pool_lock:
+            while self._pool:
+                self._pool.pop().close()
     
     def _make_request(
         self,
@@ -142,6 +455,7 @@ class DevDraftClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        query: Optional[str] = None,
     ) -> Any:
         """
         Make HTTP request with retry logic.
@@ -152,6 +466,7 @@ class DevDraftClient:
             params: Query parameters
             data: Request body data
             headers: Additional headers
+            query: Pre-encoded query string, used instead of params
             
         Returns:
             Parsed response data
@@ -159,101 +474,79 @@ class DevDraftClient:
         Raises:
             APIError: On request failure
         """
-        url = self._build_url(path)
-        request_headers = {**self.default_headers}
-        if headers:
-            request_headers.update(headers)
+        path, path_query = _split_path(path)
+        url = self._base + path
+        if query is None and params:
+            query = urlencode(params)
+        if path_query:
+            # A query string written into the path goes first, then params
+            query = f"{path_query}&{query}" if query else path_query
+        target = f"{url}?{query}" if query else url
+        # Reuse the pre-encoded default headers when there is nothing to merge
+        request_headers = (
+            self._default_header_pairs()
+            if not headers
+            else _encode_headers({**self.default_headers, **headers})
+        )
         
         # Encode request body
         body = None
         if data is not None:
-            body = json.dumps(data).encode("utf-8")
+            body = _dumps(data)
         
         # Retry loop
         for attempt in range(self.options.max_retries + 1):
             try:
-                self._log(f"{method} {url} (attempt {attempt + 1}/{self.options.max_retries + 1})")
+                if self.options.debug:
+                    self._log(
+                        f"{method} {self._origin}{url} "
+                        f"(attempt {attempt + 1}/{self.options.max_retries + 1})"
+                    )
                 
-                response = self.http.request(
-                    method,
-                    url,
-                    fields=params,
-                    body=body,
-                    headers=request_headers,
-                    preload_content=True,
-                )
+                response, response_data = self._send(method, target, body, request_headers)
                 
-                self._log(f"Response: {response.status}")
+                if self.options.debug:
+                    self._log(f"Response: {response.status}")
                 
                 # Handle successful responses
                 if 200 <= response.status < 300:
                     if response.status == 204:
                         return None
-                    return self._parse_response(response)
+                    return self._parse_response(response_data)
                 
                 # Handle retryable errors
-                retryable_statuses = {429, 500, 502, 503, 504}
-                if response.status in retryable_statuses and attempt < self.options.max_retries:
-                    # Calculate backoff
+                if response.status in _RETRYABLE_STATUSES and attempt < self.options.max_retries:
+                    # Calculate backoff, preferring the server's Retry-After when parseable
                     retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            backoff = int(retry_after)
-                        except ValueError:
-                            # Parse as date
-                            retry_date = datetime.fromisoformat(retry_after.replace("Z", "+00:00"))
-                            backoff = max(0, int((retry_date - datetime.now()).total_seconds()))
-                    else:
-                        # Exponential backoff: 2^attempt, capped at 8 seconds
-                        backoff = min(2 ** attempt, 8)
+                    server_delay = _parse_retry_after(retry_after) if retry_after else None
+                    backoff = server_delay if server_delay is not None else self._backoff(attempt)
                     
-                    self._log(f"Retrying after {backoff}s")
+                    if self.options.debug:
+                        self._log(f"Retrying after {backoff:.2f}s")
                     time.sleep(backoff)
                     continue
                 
                 # Handle error responses
-                error_data = self._parse_response(response)
+                error_data = self._parse_response(response_data)
                 raise self._create_error(response.status, error_data)
                 
-            except urllib3.exceptions.HTTPError as e:
+            except _NON_RETRYABLE_ERRORS as e:
+                # Retrying cannot fix these, but they are still normalized to APIError
+                raise APIError(f"HTTP error: {str(e)}", code="HTTP_ERROR") from e
+            except (http.client.HTTPException, OSError) as e:
+                # Transport failures (timeouts, resets, protocol errors) are retryable;
+                # anything else, including APIError for error responses, propagates
                 if attempt < self.options.max_retries:
-                    backoff = min(2 ** attempt, 8)
-                    self._log(f"HTTP error, retrying after {backoff}s: {e}")
+                    backoff = self._backoff(attempt)
+                    if self.options.debug:
+                        self._log(f"HTTP error, retrying after {backoff:.2f}s: {e}")
                     time.sleep(backoff)
                     continue
                 raise APIError(f"HTTP error: {str(e)}", code="HTTP_ERROR")
-            except Exception as e:
-                if attempt < self.options.max_retries:
-                    backoff = min(2 ** attempt, 8)
-                    self._log(f"Unexpected error, retrying after {backoff}s: {e}")
-                    time.sleep(backoff)
-                    continue
-                raise APIError(f"Unexpected error: {str(e)}", code="UNEXPECTED_ERROR")
         
         # Should not reach here, but just in case
         raise APIError("Max retries exceeded", code="MAX_RETRIES_EXCEEDED")
     
-    def _create_error(self, status: int, data: Optional[Dict[str, Any]]) -> APIError:
-        """Create APIError from response data."""
-        if data:
-            message = data.get("message", "Request failed")
-            code = data.get("code")
-            details = data.get("details")
-            request_id = data.get("requestId")
-        else:
-            message = f"Request failed with status {status}"
-            code = None
-            details = None
-            request_id = None
-        
-        return APIError(
-            message=message,
-            status=status,
-            code=code,
-            details=details,
-            request_id=request_id,
-        )
-    
     def get(
         self,
         path: str,
@@ -368,19 +661,36 @@ class DevDraftClient:
             >>> for customer in client.paginate_cursor('/customers'):
             ...     print(customer['email'])
         """
+        for items in self._cursor_pages(
+            path, params, cursor_param, items_key, next_cursor_key, has_more_key
+        ):
+            yield from items
+    
+    def _cursor_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        cursor_param: str = "cursor",
+        items_key: str = "items",
+        next_cursor_key: str = "nextCursor",
+        has_more_key: str = "hasMore",
+    ) -> Generator[List[Any], None, None]:
+        """Yield the items list of each page of cursor-based results."""
+        # Encode the static params once; only the cursor changes between pages
+        params = params or {}
+        query = urlencode(params)
+        static_query = urlencode({k: v for k, v in params.items() if k != cursor_param})
+        cursor_prefix = f"{static_query}&" if static_query else ""
+        cursor_prefix += f"{quote_plus(cursor_param)}="
         cursor = None
         has_more = True
-        query_params = dict(params or {})
         
         while has_more:
             if cursor:
-                query_params[cursor_param] = cursor
+                query = cursor_prefix + quote_plus(str(cursor))
             
-            response = self.get(path, query_params)
-            items = response.get(items_key, [])
-            
-            for item in items:
-                yield item
+            response = self._make_request("GET", path, query=query)
+            yield response.get(items_key, [])
             
             cursor = response.get(next_cursor_key)
             has_more = response.get(has_more_key, False)
@@ -416,18 +726,31 @@ class DevDraftClient:
             >>> for product in client.paginate_page('/products', {'perPage': 50}):
             ...     print(product['name'])
         """
+        for items in self._numbered_pages(
+            path, params, page_param, per_page_param, items_key, total_pages_key
+        ):
+            yield from items
+    
+    def _numbered_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        page_param: str = "page",
+        per_page_param: str = "perPage",
+        items_key: str = "items",
+        total_pages_key: str = "totalPages",
+    ) -> Generator[List[Any], None, None]:
+        """Yield the items list of each page of page-based results."""
+        # Encode the static params once; only the page number changes between pages
+        static_query = urlencode({k: v for k, v in (params or {}).items() if k != page_param})
+        page_prefix = f"{static_query}&" if static_query else ""
+        page_prefix += f"{quote_plus(page_param)}="
         page = 1
         total_pages = 1
-        query_params = dict(params or {})
         
         while page <= total_pages:
-            query_params[page_param] = page
-            
-            response = self.get(path, query_params)
-            items = response.get(items_key, [])
-            
-            for item in items:
-                yield item
+            response = self._make_request("GET", path, query=page_prefix + str(page))
+            yield response.get(items_key, [])
             
             total_pages = response.get(total_pages_key, page)
             page += 1
@@ -447,7 +770,10 @@ class DevDraftClient:
         Returns:
             List of all items
         """
-        return list(self.paginate_cursor(path, params))
+        result: List[Any] = []
+        for items in self._cursor_pages(path, params):
+            result.extend(items)
+        return result
     
     def get_all_page(
         self,
@@ -464,7 +790,10 @@ class DevDraftClient:
         Returns:
             List of all items
         """
-        return list(self.paginate_page(path, params))
+        result: List[Any] = []
+        for items in self._numbered_pages(path, params):
+            result.extend(items)
+        return result
 
 
 # Convenience exports